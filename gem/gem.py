@@ -219,20 +219,25 @@ class Literal(Constant):
 
     def __init__(self, array):
         array = asarray(array)
+        # Store C-contiguous copies, so that all later passes over
+        # transposed tabulations (rounding, hashing, code generation)
+        # run with unit stride.
         try:
-            self.array = array.astype(float, casting="safe")
+            self.array = array.astype(float, order="C", casting="safe")
         except TypeError:
-            self.array = array.astype(complex)
+            self.array = array.astype(complex, order="C")
+        # No minus zeros, so that equal tables have equal bytes
+        self.array += 0.0
 
     def is_equal(self, other):
         if type(self) != type(other):
             return False
-        if self.shape != other.shape:
+        if self.shape != other.shape or self.array.dtype != other.array.dtype:
             return False
-        return tuple(self.array.flat) == tuple(other.array.flat)
+        return self.array.tobytes() == other.array.tobytes()
 
     def get_hash(self):
-        return hash((type(self), self.shape, tuple(self.array.flat)))
+        return hash((type(self), self.shape, self.array.dtype, self.array.tobytes()))
 
     @property
     def value(self):
@@ -715,6 +720,20 @@ class ListTensor(Node):
         child_shape = array.flat[0].shape
         assert all(elem.shape == child_shape for elem in array.flat)
 
+        # Constant folding: stack constants directly into a
+        # preallocated array, without destroying their structure
+        if all(isinstance(elem, Constant) for elem in array.flat):
+            dtype = float
+            if any(isinstance(elem, Literal) and elem.array.dtype == complex
+                   for elem in array.flat):
+                dtype = complex
+            values = numpy.zeros(array.shape + child_shape, dtype=dtype)
+            for alpha in numpy.ndindex(array.shape):
+                elem = array[alpha]
+                if not isinstance(elem, Zero):
+                    values[alpha] = elem.array
+            return Literal(values)
+
         if child_shape:
             # Destroy structure
             direct_array = numpy.empty(array.shape + child_shape, dtype=object)
@@ -743,7 +762,11 @@ class ListTensor(Node):
         return type(self), (self.array,)
 
     def reconstruct(self, *args):
-        return ListTensor(asarray(args).reshape(self.array.shape))
+        array = numpy.empty(self.array.shape, dtype=object)
+        assert len(args) == array.size
+        for alpha, arg in zip(numpy.ndindex(array.shape), args):
+            array[alpha] = arg
+        return ListTensor(array)
 
     def __repr__(self):
         return "ListTensor(%r)" % self.array.tolist()
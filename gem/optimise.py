@@ -37,21 +37,43 @@ def literal_rounding_literal(node, self):
     epsilon = self.epsilon
     # Mimic the rounding applied at COFFEE formatting, which in turn
     # mimics FFC formatting.
-    one_decimal = numpy.asarray(numpy.round(table, 1))
-    one_decimal[numpy.logical_not(one_decimal)] = 0  # no minus zeros
-    return Literal(numpy.where(abs(table - one_decimal) < epsilon, one_decimal, table))
+    # The rounding is done in a single buffer: the entries that are not
+    # close to their rounded value are restored from the table, and
+    # Literal turns minus zeros into plus zeros.
+    one_decimal = numpy.round(table, 1, out=numpy.empty_like(table))
+    numpy.copyto(one_decimal, table, where=abs(table - one_decimal) >= epsilon)
+    return Literal(one_decimal)
 
 
-def ffc_rounding(expression, epsilon):
+def ffc_rounding(expression, epsilon, cache=None):
     """Perform FFC rounding of FIAT tabulation matrices on the literals of
     a GEM expression.
 
     :arg expression: GEM expression
     :arg epsilon: tolerance limit for rounding
+    :arg cache: optional dict of rounded nodes, see
+                :func:`ffc_rounding_expressions`
+    """
+    expression, = ffc_rounding_expressions([expression], epsilon, cache=cache)
+    return expression
+
+
+def ffc_rounding_expressions(expressions, epsilon, cache=None):
+    """Perform FFC rounding of FIAT tabulation matrices on the literals of
+    multiple GEM expressions in a single pass, so that literals shared
+    between the expressions are only rounded once.
+
+    :arg expressions: list of GEM expressions
+    :arg epsilon: tolerance limit for rounding
+    :arg cache: optional dict of rounded nodes, to be shared between
+                calls with the same epsilon, so that equal tables are
+                only rounded once across calls
     """
     mapper = Memoizer(literal_rounding)
     mapper.epsilon = epsilon
-    return mapper(expression)
+    if cache is not None:
+        mapper.cache = cache
+    return list(map(mapper, expressions))
 
 
 @singledispatch
@@ -481,6 +503,58 @@ def traverse_sum(expression, stop_at=None):
     return result
 
 
+def nonzero_contraction(table, vector, indices):
+    """Constructs the contraction of a tabulation table and a
+    coefficient vector, summing only over those entries where the table
+    is not identically zero.  Semantically equivalent to
+
+        IndexSum(Product(table, vector), indices)
+
+    If ``table`` is not an indexed :class:`Literal`, or it has no
+    vanishing slices along the summation indices, the dense contraction
+    is returned.
+
+    :arg table: GEM expression for the table
+    :arg vector: GEM expression for the coefficient vector, free in
+                 (a subset of) ``indices``
+    :arg indices: summation indices
+    :returns: a GEM expression
+    """
+    dense = IndexSum(Product(table, vector), indices)
+
+    table, = remove_componenttensors([table])
+    if not (isinstance(table, Indexed) and isinstance(table.children[0], Literal)):
+        return dense
+    if not indices or not set(vector.free_indices) <= set(indices):
+        return dense
+    if any(table.multiindex.count(index) != 1 for index in indices):
+        return dense
+
+    # Move the summation axes to the front, and find the summation
+    # positions where the table has any nonzero entry.
+    literal, = table.children
+    axes = tuple(table.multiindex.index(index) for index in indices)
+    array = numpy.moveaxis(literal.array, axes, tuple(range(len(axes))))
+    shape = array.shape[:len(axes)]
+    mask = (array != 0).reshape(shape + (-1,)).any(axis=-1)
+    if mask.all():
+        return dense
+
+    # An all-zero Literal is already a Zero
+    nonzeros = numpy.argwhere(mask)
+    assert len(nonzeros) > 0
+
+    k = Index(extent=len(nonzeros))
+    rest = tuple(i for a, i in enumerate(table.multiindex) if a not in axes)
+    sparse_table = Indexed(Literal(array[tuple(nonzeros.T)]), (k,) + rest)
+
+    mapper = MemoizerArg(filtered_replace_indices)
+    entries = [mapper(vector, tuple(zip(indices, map(int, position))))
+               for position in nonzeros]
+    sparse_vector = Indexed(ListTensor(entries), (k,))
+    return IndexSum(Product(sparse_table, sparse_vector), (k,))
+
+
 def contraction(expression):
     """Optimise the contractions of the tensor product at the root of
     the expression, including:
@@ -519,9 +593,10 @@ def contraction(expression):
         tensor = ComponentTensor(expression, lt_fis)
         entries = [Indexed(tensor, zeta) for zeta in numpy.ndindex(tensor.shape)]
         entries = remove_componenttensors(entries)
-        return Indexed(ListTensor(
-            numpy.array(list(map(rebuild, entries))).reshape(tensor.shape)
-        ), lt_fis)
+        array = numpy.empty(tensor.shape, dtype=object)
+        for zeta, entry in zip(numpy.ndindex(tensor.shape), entries):
+            array[zeta] = rebuild(entry)
+        return Indexed(ListTensor(array), lt_fis)
     else:
         # Rebuild whole expression at once
         return rebuild(expression)
@@ -588,26 +663,37 @@ def _(node, self):
         # Unrolling
         summand = self(node.children[0])
         shape = tuple(index.extent for index in unroll)
-        unrolled = reduce(Sum,
-                          (Indexed(ComponentTensor(summand, unroll), alpha)
-                           for alpha in numpy.ndindex(shape)),
-                          Zero())
+        if self.substitute:
+            # Substitute the unrolled indices right away, so that
+            # vanishing terms fold to zero and are left out of the sum
+            mapper = MemoizerArg(filtered_replace_indices)
+            terms = (mapper(summand, tuple(zip(unroll, alpha)))
+                     for alpha in numpy.ndindex(shape))
+            terms = (term for term in terms if not isinstance(term, Zero))
+        else:
+            terms = (Indexed(ComponentTensor(summand, unroll), alpha)
+                     for alpha in numpy.ndindex(shape))
+        unrolled = reduce(Sum, terms, Zero())
         return IndexSum(unrolled, tuple(index for index in node.multiindex
                                         if index not in unroll))
     else:
         return reuse_if_untouched(node, self)
 
 
-def unroll_indexsum(expressions, predicate):
+def unroll_indexsum(expressions, predicate, substitute=False):
     """Unrolls IndexSums below a specified extent.
 
     :arg expressions: list of expression DAGs
     :arg predicate: a predicate function on :py:class:`Index` objects
                     that tells whether to unroll a particular index
+    :arg substitute: substitute the unrolled indices into each term,
+                     instead of indexing a :py:class:`ComponentTensor`,
+                     so that only the nonzero terms are summed
     :returns: list of expression DAGs with some unrolled IndexSums
     """
     mapper = Memoizer(_unroll_indexsum)
     mapper.predicate = predicate
+    mapper.substitute = substitute
     return list(map(mapper, expressions))
 
 
@@ -621,6 +707,7 @@ def aggressive_unroll(expression):
         expression, = remove_componenttensors((ListTensor(tensor),))
 
     # Unroll summation
-    expression, = unroll_indexsum((expression,), predicate=lambda index: True)
+    expression, = unroll_indexsum((expression,), predicate=lambda index: True,
+                                  substitute=True)
     expression, = remove_componenttensors((expression,))
     return expression
@@ -0,0 +1,57 @@
+import numpy
+import pytest
+
+from gem.gem import Index, Indexed, Literal, Zero
+from gem.optimise import ffc_rounding, ffc_rounding_expressions
+
+
+def test_ffc_rounding():
+    epsilon = 1e-12
+    table = numpy.array([[0.5 + 1e-14, 1.0 - 1e-14, 0.3],
+                         [-1e-14, 0.25, -0.7 + 1e-14]])
+    result = ffc_rounding(Literal(table), epsilon)
+
+    expected = numpy.array([[0.5, 1.0, 0.3],
+                            [0.0, 0.25, -0.7]])
+    assert (result.array == expected).all()
+    # No minus zeros
+    assert not numpy.signbit(result.array[1, 0])
+
+
+def test_ffc_rounding_scalar():
+    assert ffc_rounding(Literal(-1e-14), 1e-12) == Zero()
+    assert ffc_rounding(Literal(0.2 + 1e-14), 1e-12) == Literal(0.2)
+
+
+def test_ffc_rounding_complex():
+    table = numpy.array([0.5 + 1e-14 - 1e-14j, 0.3 + 0.25j])
+    result = ffc_rounding(Literal(table), 1e-12)
+    assert (result.array == numpy.array([0.5, 0.3 + 0.25j])).all()
+
+
+def test_ffc_rounding_nan():
+    table = numpy.array([numpy.nan, 1e-14, 0.7])
+    result = ffc_rounding(Literal(table), 1e-12)
+    assert numpy.isnan(result.array[0])
+    assert (result.array[1:] == [0.0, 0.7]).all()
+
+
+def test_ffc_rounding_expressions_shared_literal():
+    table = Literal(numpy.array([1e-14, 0.5 - 1e-14]))
+    a, b = ffc_rounding_expressions([Indexed(table, (Index(),)),
+                                     Indexed(table, (Index(),))], 1e-12)
+    assert a.children[0] is b.children[0]
+    assert (a.children[0].array == [0.0, 0.5]).all()
+
+
+def test_ffc_rounding_shared_cache():
+    cache = {}
+    a = ffc_rounding(Literal(numpy.array([1e-14, 0.5])), 1e-12, cache=cache)
+    b = ffc_rounding(Literal(numpy.array([1e-14, 0.5])), 1e-12, cache=cache)
+    assert a is b
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
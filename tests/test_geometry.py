@@ -4,7 +4,7 @@ import numpy as np
 from FIAT.reference_element import UFCInterval, UFCTriangle, UFCTetrahedron
 from FIAT.reference_element import UFCQuadrilateral, TensorProductCell
 
-from tsfc.fem import make_cell_facet_jacobian
+from tsfc.fem import apply_affine_transform, make_cell_facet_jacobian
 
 interval = UFCInterval()
 triangle = UFCTriangle()
@@ -70,6 +70,24 @@ def test_cell_facet_jacobian_vert(cell, cell_facet_jacobian):
         assert np.allclose(expected, actual)
 
 
+@pytest.mark.parametrize('cell', [interval, triangle, quadrilateral, tetrahedron,
+                                  interval_x_interval, triangle_x_interval,
+                                  quadrilateral_x_interval])
+def test_apply_affine_transform(cell):
+    for dim, entities in cell.get_topology().items():
+        points = np.random.rand(5, cell.construct_subelement(dim).get_spatial_dimension())
+        for entity in entities:
+            t = cell.get_entity_transform(dim, entity)
+            expected = np.asarray([t(x) for x in points])
+            assert np.allclose(apply_affine_transform(t, points), expected)
+
+
+def test_apply_affine_transform_vertex():
+    t = triangle.get_entity_transform(0, 2)
+    actual = apply_affine_transform(t, np.zeros((1, 0)))
+    assert np.allclose(actual, [[0.0, 1.0]])
+
+
 if __name__ == "__main__":
     import os
     import sys
@@ -0,0 +1,41 @@
+import numpy
+import pytest
+
+from gem.gem import Identity, Index, Indexed, ListTensor, Literal, Zero
+
+
+def test_list_tensor_stacks_literals():
+    a = numpy.arange(6, dtype=float).reshape(2, 3)
+    b = -a
+    expr = ListTensor([Literal(a), Zero((2, 3)), Literal(b)])
+
+    assert isinstance(expr, Literal)
+    assert expr.shape == (3, 2, 3)
+    assert (expr.array == numpy.array([a, numpy.zeros((2, 3)), b])).all()
+
+
+def test_list_tensor_stacks_complex_literals():
+    expr = ListTensor([Literal(1.0), Literal(2j)])
+    assert expr == Literal(numpy.array([1.0, 2j]))
+
+
+def test_list_tensor_stacks_identity():
+    expr = ListTensor([Identity(2), Zero((2, 2))])
+    assert expr == Literal(numpy.array([numpy.eye(2), numpy.zeros((2, 2))]))
+
+
+def test_list_tensor_all_zero():
+    assert ListTensor([Zero((2,)), Zero((2,))]) == Zero((2, 2))
+
+
+def test_list_tensor_not_constant():
+    i = Index()
+    a = Literal(numpy.array([1.0, 2.0]))
+    expr = ListTensor([Indexed(a, (i,)), Literal(3.0)])
+    assert isinstance(expr, ListTensor)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
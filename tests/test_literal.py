@@ -0,0 +1,27 @@
+import numpy
+import pytest
+
+from gem.gem import Literal
+
+
+def test_literal_equality():
+    a = numpy.random.rand(4, 5)
+    assert Literal(a) == Literal(a.copy())
+    assert hash(Literal(a)) == hash(Literal(a.copy()))
+    assert Literal(a) != Literal(a + 1.0)
+    assert Literal(a) != Literal(a.reshape(5, 4))
+
+
+def test_literal_equality_transposed():
+    a = numpy.random.rand(4, 5)
+    assert Literal(a.T) == Literal(numpy.ascontiguousarray(a.T))
+
+
+def test_literal_equality_minus_zero():
+    assert Literal(numpy.array([-0.0, 1.0])) == Literal(numpy.array([0.0, 1.0]))
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
@@ -0,0 +1,95 @@
+import numpy
+import pytest
+
+import loopy
+from ufl import (Mesh, FunctionSpace, FiniteElement, VectorElement,
+                 TestFunction, TrialFunction, triangle, dx)
+
+import gem
+from tsfc import compile_form
+from tsfc.loopy import assign_dtypes
+
+
+def dtypes(expressions, scalar_type, table_type=None):
+    if table_type is not None:
+        table_type = numpy.dtype(table_type)
+    return [dtype for _, dtype in assign_dtypes(expressions, numpy.dtype(scalar_type), table_type)]
+
+
+@pytest.fixture
+def i():
+    return gem.Index(extent=3)
+
+
+@pytest.fixture
+def real_table(i):
+    return gem.Indexed(gem.Literal(numpy.linspace(0.5, 1.5, 3)), (i,))
+
+
+@pytest.fixture
+def complex_table(i):
+    return gem.Indexed(gem.Literal(numpy.linspace(0.5, 1.5, 3) * 1j), (i,))
+
+
+@pytest.fixture
+def coefficient(i):
+    return gem.Indexed(gem.Variable("w", (3,)), (i,))
+
+
+@pytest.fixture
+def identity(i):
+    return gem.Indexed(gem.Identity(3), (i, i))
+
+
+def test_float32_default(real_table, coefficient, identity):
+    product = gem.Product(real_table, coefficient)
+    literal, = real_table.children
+    assert dtypes([literal, identity, product], numpy.float32) == \
+        [numpy.float64, numpy.float32, numpy.float64]
+
+
+def test_float32(real_table, coefficient, identity):
+    product = gem.Product(real_table, coefficient)
+    literal, = real_table.children
+    assert dtypes([literal, identity, product], numpy.float32, numpy.float32) == [numpy.float32] * 3
+
+
+def test_complex64_default(real_table, complex_table, coefficient, identity):
+    product = gem.Product(real_table, coefficient)
+    literal, = real_table.children
+    complex_literal, = complex_table.children
+    assert dtypes([literal, complex_literal, identity, product], numpy.complex64) == \
+        [numpy.float64, numpy.complex128, numpy.float32, numpy.complex128]
+
+
+def test_complex64(real_table, complex_table, coefficient, identity):
+    product = gem.Product(real_table, coefficient)
+    literal, = real_table.children
+    complex_literal, = complex_table.children
+    assert dtypes([literal, complex_literal, identity, product], numpy.complex64, numpy.float32) == \
+        [numpy.float32, numpy.complex64, numpy.float32, numpy.complex64]
+
+
+def mass():
+    m = Mesh(VectorElement('CG', triangle, 1))
+    V = FunctionSpace(m, FiniteElement('CG', triangle, 2))
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return u*v*dx
+
+
+@pytest.mark.parametrize(('table_type', 'double'),
+                         [(None, True),
+                          (numpy.dtype(numpy.float32), False)])
+def test_float32_kernel(table_type, double):
+    parameters = {"scalar_type": numpy.dtype(numpy.float32),
+                  "table_type": table_type}
+    kernel, = compile_form(mass(), parameters=parameters, coffee=False)
+    code = loopy.generate_code_v2(kernel.ast).device_code()
+    assert ("double" in code) == double
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
@@ -0,0 +1,41 @@
+import pytest
+
+from coffee.visitors import EstimateFlops
+
+from ufl import (Mesh, FunctionSpace, FiniteElement, VectorElement,
+                 Coefficient, TestFunction, interval, ds)
+
+import gem
+from tsfc import compile_form
+
+
+def dense_contraction(table, vector, indices):
+    return gem.IndexSum(gem.Product(table, vector), indices)
+
+
+def facet_form():
+    # The midpoint basis function of P2 vanishes on both facets of an
+    # interval, so only two of the three basis functions contribute.
+    m = Mesh(VectorElement('CG', interval, 1))
+    V = FunctionSpace(m, FiniteElement('CG', interval, 2))
+    f = Coefficient(V)
+    v = TestFunction(V)
+    return f*v*ds
+
+
+def count_flops(form):
+    kernel, = compile_form(form, parameters=dict(mode='spectral'))
+    return EstimateFlops().visit(kernel.ast)
+
+
+def test_pruned_coefficient_flops(monkeypatch):
+    pruned = count_flops(facet_form())
+    monkeypatch.setattr(gem.optimise, "nonzero_contraction", dense_contraction)
+    dense = count_flops(facet_form())
+    assert pruned < dense
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
@@ -0,0 +1,45 @@
+import numpy
+import pytest
+
+from gem.gem import (ComponentTensor, Index, Indexed, IndexSum, Literal,
+                     Product, Variable)
+from gem.interpreter import evaluate
+from gem.optimise import nonzero_contraction
+
+
+def test_nonzero_contraction():
+    q = Index(extent=4)
+    i = Index(extent=3)
+    j = Index(extent=2)
+    array = numpy.random.rand(3, 4, 2)
+    array[1] = 0
+    array[2, :, 0] = 0
+    table = Indexed(Literal(array), (i, q, j))
+    v = Variable("v", (3, 2))
+    vector = Indexed(v, (i, j))
+
+    expr = nonzero_contraction(table, vector, (i, j))
+    k, = expr.multiindex
+    assert k.extent == 3
+
+    dense = IndexSum(Product(table, vector), (i, j))
+    bindings = {v: numpy.random.rand(3, 2)}
+    expected, = evaluate([ComponentTensor(dense, (q,))], bindings)
+    actual, = evaluate([ComponentTensor(expr, (q,))], bindings)
+    assert numpy.allclose(expected.arr, actual.arr)
+
+
+def test_nonzero_contraction_dense():
+    q = Index(extent=4)
+    i = Index(extent=3)
+    table = Indexed(Literal(numpy.random.rand(4, 3) + 1), (q, i))
+    vector = Indexed(Variable("v", (3,)), (i,))
+
+    expr = nonzero_contraction(table, vector, (i,))
+    assert expr == IndexSum(Product(table, vector), (i,))
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
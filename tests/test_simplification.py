@@ -1,7 +1,11 @@
+import numpy
 import pytest
 
 from gem.gem import Variable, Zero, Conditional, \
-    LogicalAnd, Index, Indexed, Product
+    LogicalAnd, Index, Indexed, Product, Sum, Literal, IndexSum, \
+    ComponentTensor
+from gem.node import traversal
+from gem.optimise import aggressive_unroll, unroll_indexsum
 
 
 def test_conditional_simplification():
@@ -25,6 +29,37 @@ def test_conditional_zero_folding():
     assert expr == Zero()
 
 
+def test_aggressive_unroll_sparse():
+    # Regression guard: the unrolled expression is the same whether or
+    # not zero terms are dropped while unrolling.
+    i = Index()
+    a = Variable("A", (4,))
+    table = Literal(numpy.array([1.0, 0.0, 0.0, -1.0]))
+    expr = IndexSum(Product(Indexed(table, (i,)), Indexed(a, (i,))), (i,))
+
+    assert aggressive_unroll(expr) == Sum(Indexed(a, (0,)),
+                                          Product(Literal(-1.0), Indexed(a, (3,))))
+
+
+def test_unroll_indexsum_substitute():
+    i = Index()
+    a = Variable("A", (4,))
+    table = Literal(numpy.array([1.0, 0.0, 0.0, -1.0]))
+    expr = IndexSum(Product(Indexed(table, (i,)), Indexed(a, (i,))), (i,))
+
+    # Without substitution, every term indexes a ComponentTensor, and
+    # zero terms are only folded away later.
+    unrolled, = unroll_indexsum([expr], predicate=lambda index: True)
+    assert any(isinstance(node, ComponentTensor) for node in traversal([unrolled]))
+
+    # With substitution, the sum is built from the nonzero terms only.
+    unrolled, = unroll_indexsum([expr], predicate=lambda index: True,
+                                substitute=True)
+    assert not any(isinstance(node, ComponentTensor) for node in traversal([unrolled]))
+    assert unrolled == Sum(Indexed(a, (0,)),
+                           Product(Literal(-1.0), Indexed(a, (3,))))
+
+
 if __name__ == "__main__":
     import os
     import sys
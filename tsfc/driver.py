@@ -95,6 +95,7 @@ def compile_integral(integral_data, form_data, prefix, parameters, interface, co
         scalar_type = parameters["scalar_type_c"]
     else:
         scalar_type = parameters["scalar_type"]
+    builder_kwargs = table_type_kwargs(parameters, coffee)
 
     # Remove these here, they're handled below.
     if parameters.get("quadrature_degree") in ["auto", "default", None, -1, "-1"]:
@@ -121,7 +122,8 @@ def compile_integral(integral_data, form_data, prefix, parameters, interface, co
     builder = interface(integral_type, integral_data.subdomain_id,
                         domain_numbering[integral_data.domain],
                         scalar_type,
-                        diagonal=diagonal)
+                        diagonal=diagonal,
+                        **builder_kwargs)
     argument_multiindices = tuple(builder.create_element(arg.ufl_element()).get_indices()
                                   for arg in arguments)
     if diagonal:
@@ -322,7 +324,7 @@ def compile_expression_dual_evaluation(expression, to_element, *,
             import tsfc.kernel_interface.firedrake_loopy as firedrake_interface_loopy
             interface = firedrake_interface_loopy.ExpressionKernelBuilder
 
-    builder = interface(parameters["scalar_type"])
+    builder = interface(parameters["scalar_type"], **table_type_kwargs(parameters, coffee))
     arguments = extract_arguments(expression)
     argument_multiindices = tuple(builder.create_element(arg.ufl_element()).get_indices()
                                   for arg in arguments)
@@ -489,6 +491,22 @@ def lower_integral_type(fiat_cell, integral_type):
     return integration_dim, entity_ids
 
 
+def table_type_kwargs(parameters, coffee):
+    """Keyword arguments for the kernel builder to select the precision
+    of literal tables.  Only the loopy backend takes the table type, and
+    it is only passed when requested, so that the interfaces need not
+    know about it otherwise.
+
+    :arg parameters: parameters object
+    :arg coffee: whether a COFFEE kernel is built
+    :returns: a dict of keyword arguments
+    """
+    if coffee or parameters["table_type"] is None:
+        return {}
+    else:
+        return {"table_type": parameters["table_type"]}
+
+
 def pick_mode(mode):
     "Return one of the specialized optimisation modules from a mode string."
     try:
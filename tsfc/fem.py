@@ -3,7 +3,7 @@ geometric quantities into GEM expressions."""
 
 import collections
 import itertools
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 import numpy
 
@@ -27,7 +27,7 @@ from FIAT.reference_element import UFCSimplex
 
 import gem
 from gem.node import traversal
-from gem.optimise import ffc_rounding
+from gem.optimise import ffc_rounding, ffc_rounding_expressions
 from gem.unconcatenate import unconcatenate
 from gem.utils import cached_property
 
@@ -108,6 +108,12 @@ class ContextBase(ProxyKernelInterface):
     def index_cache(self):
         return {}
 
+    @cached_property
+    def rounding_cache(self):
+        """FFC rounded tabulation tables, shared by all modified
+        terminals translated in this context."""
+        return {}
+
     @cached_property
     def translator(self):
         # NOTE: reference cycle!
@@ -321,6 +327,10 @@ class Translator(MultiFunction, ModifiedTerminalMixin, ufl2gem.Mixin):
         # Need context during translation!
         self.context = context
 
+        # Analysed modified terminals, also filled when picking
+        # restrictions for interior facet integrals.
+        self.mt_cache = {}
+
     # We just use the provided quadrature rule to
     # perform the integration.
     # Can't put these in the ufl2gem mixin, since they (unlike
@@ -363,7 +373,9 @@ class Translator(MultiFunction, ModifiedTerminalMixin, ufl2gem.Mixin):
     def modified_terminal(self, o):
         """Overrides the modified terminal handler from
         :class:`ModifiedTerminalMixin`."""
-        mt = analyse_modified_terminal(o)
+        mt = self.mt_cache.get(o)
+        if mt is None:
+            mt = self.mt_cache[o] = analyse_modified_terminal(o)
         return translate(mt.terminal, mt, self.context)
 
 
@@ -418,7 +430,10 @@ def translate_cell_facet_jacobian(terminal, mt, ctx):
     return ctx.entity_selector(callback, mt.restriction)
 
 
+@lru_cache(maxsize=None)
 def make_cell_facet_jacobian(cell, facet_dim, facet_i):
+    # Cached, since the affinity check below is only needed once per
+    # facet of a reference cell.
     facet_cell = cell.construct_subelement(facet_dim)
     xs = facet_cell.get_vertices()
     ys = cell.get_vertices_of_subcomplex(cell.get_topology()[facet_dim][facet_i])
@@ -432,6 +447,7 @@ def make_cell_facet_jacobian(cell, facet_dim, facet_i):
         # mapping really *is* affine.
         assert numpy.allclose(y, A.dot(x) + b)
 
+    A.flags.writeable = False
     return A
 
 
@@ -451,7 +467,7 @@ def translate_reference_cell_edge_vectors(terminal, mt, ctx):
         raise NotImplementedError("ReferenceCellEdgeVectors not implemented on TensorProductElements yet")
 
     nedges = len(fiat_cell.get_topology()[1])
-    vecs = numpy.vstack(map(fiat_cell.compute_edge_tangent, range(nedges)))
+    vecs = numpy.asarray([fiat_cell.compute_edge_tangent(e) for e in range(nedges)])
     assert vecs.shape == terminal.ufl_shape
     return gem.Literal(vecs)
 
@@ -469,13 +485,31 @@ def translate_cell_coordinate(terminal, mt, ctx):
 
     def callback(entity_id):
         t = ctx.fiat_cell.get_entity_transform(ctx.integration_dim, entity_id)
-        data = numpy.asarray(list(map(t, ps.points)))
+        data = apply_affine_transform(t, ps.points)
         return gem.Literal(data.reshape(point_shape + data.shape[1:]))
 
     return gem.partial_indexed(ctx.entity_selector(callback, mt.restriction),
                                ps.indices)
 
 
+def apply_affine_transform(t, points):
+    """Apply an affine transform to all points at once.
+
+    :arg t: affine transform of a single point, such as a FIAT entity
+            transform
+    :arg points: array of points with shape (num_points, dim)
+    :returns: array of the transformed points
+    """
+    points = numpy.asarray(points)
+    dim = points.shape[-1]
+    # Recover the matrix and the offset of the transform from its
+    # action on the origin and on the unit vectors.
+    b = numpy.asarray(t(numpy.zeros(dim)), dtype=float)
+    At = numpy.array([numpy.asarray(t(e), dtype=float) - b
+                      for e in numpy.eye(dim)]).reshape(dim, len(b))
+    return numpy.dot(points, At) + b
+
+
 @translate.register(FacetCoordinate)
 def translate_facet_coordinate(terminal, mt, ctx):
     assert ctx.integration_dim != ctx.fiat_cell.get_dimension()
@@ -584,6 +618,20 @@ def translate_cell_edge_vectors(terminal, mt, ctx):
     return gem.ComponentTensor(gem.Indexed(expr, (e,)), (e, c))
 
 
+@lru_cache(maxsize=None)
+def _ufl_to_fiat_derivatives(dimension, order):
+    """Pairs of UFL derivative multiindex (one direction per
+    derivative) and the corresponding FIAT derivative multiindex (order
+    of derivative per direction) for all derivatives of a given order.
+
+    :arg dimension: reference dimension
+    :arg order: derivative order
+    """
+    eye = numpy.eye(dimension, dtype=int)
+    return tuple((multiindex, tuple(int(a) for a in eye[multiindex, :].sum(axis=0)))
+                 for multiindex in numpy.ndindex((dimension,) * order))
+
+
 def fiat_to_ufl(fiat_dict, order):
     # All derivative multiindices must be of the same dimension.
     dimension, = set(len(alpha) for alpha in fiat_dict.keys())
@@ -593,10 +641,8 @@ def fiat_to_ufl(fiat_dict, order):
     sigma = tuple(gem.Index(extent=extent) for extent in shape)
 
     # Convert from FIAT to UFL format
-    eye = numpy.eye(dimension, dtype=int)
     tensor = numpy.empty((dimension,) * order, dtype=object)
-    for multiindex in numpy.ndindex(tensor.shape):
-        alpha = tuple(eye[multiindex, :].sum(axis=0))
+    for multiindex, alpha in _ufl_to_fiat_derivatives(dimension, order):
         tensor[multiindex] = gem.Indexed(fiat_dict[alpha], sigma)
     delta = tuple(gem.Index(extent=dimension) for _ in range(order))
     if order > 0:
@@ -624,7 +670,7 @@ def translate_argument(terminal, mt, ctx):
 
         # A numerical hack that FFC used to apply on FIAT tables still
         # lives on after ditching FFC and switching to FInAT.
-        return ffc_rounding(square, ctx.epsilon)
+        return ffc_rounding(square, ctx.epsilon, cache=ctx.rounding_cache)
     table = ctx.entity_selector(callback, mt.restriction)
     return gem.ComponentTensor(gem.Indexed(table, argument_multiindex + sigma), sigma)
 
@@ -639,18 +685,28 @@ def translate_coefficient(terminal, mt, ctx):
 
     element = ctx.create_element(terminal.ufl_element(), restriction=mt.restriction)
 
-    # Collect FInAT tabulation for all entities
-    per_derivative = collections.defaultdict(list)
+    # Collect FInAT tabulation for all entities.  This is deliberately
+    # sequential: FInAT builds GEM nodes while tabulating, and the
+    # numbering of gem.Index objects, which orders indices and names
+    # them in the generated code, must stay deterministic.
+    alphas = []
+    tables = []
     for entity_id in ctx.entity_ids:
         finat_dict = ctx.basis_evaluation(element, mt, entity_id)
         for alpha, table in finat_dict.items():
             # Filter out irrelevant derivatives
             if sum(alpha) == mt.local_derivatives:
-                # A numerical hack that FFC used to apply on FIAT
-                # tables still lives on after ditching FFC and
-                # switching to FInAT.
-                table = ffc_rounding(table, ctx.epsilon)
-                per_derivative[alpha].append(table)
+                alphas.append(alpha)
+                tables.append(table)
+
+    # A numerical hack that FFC used to apply on FIAT tables still
+    # lives on after ditching FFC and switching to FInAT.  Tables of
+    # all entities and derivatives are rounded together, so that
+    # literals they share are only rounded once.
+    tables = ffc_rounding_expressions(tables, ctx.epsilon, cache=ctx.rounding_cache)
+    per_derivative = collections.defaultdict(list)
+    for alpha, table in zip(alphas, tables):
+        per_derivative[alpha].append(table)
 
     # Merge entity tabulations for each derivative
     if len(ctx.entity_ids) == 1:
@@ -665,8 +721,11 @@ def translate_coefficient(terminal, mt, ctx):
                           for alpha, tables in per_derivative.items()}
 
     # Coefficient evaluation
-    ctx.index_cache.setdefault(terminal.ufl_element(), element.get_indices())
-    beta = ctx.index_cache[terminal.ufl_element()]
+    try:
+        beta = ctx.index_cache[terminal.ufl_element()]
+    except KeyError:
+        # Only create basis function indices on first use
+        beta = ctx.index_cache[terminal.ufl_element()] = element.get_indices()
     zeta = element.get_value_indices()
     vec_beta, = gem.optimise.remove_componenttensors([gem.Indexed(vec, beta)])
     value_dict = {}
@@ -675,7 +734,8 @@ def translate_coefficient(terminal, mt, ctx):
         summands = []
         for var, expr in unconcatenate([(vec_beta, table_qi)], ctx.index_cache):
             indices = tuple(i for i in var.index_ordering() if i not in ctx.unsummed_coefficient_indices)
-            value = gem.IndexSum(gem.Product(expr, var), indices)
+            # Only sum over basis functions whose table is nonzero
+            value = gem.optimise.nonzero_contraction(expr, var, indices)
             summands.append(gem.optimise.contraction(value))
         optimised_value = gem.optimise.make_sum(summands)
         value_dict[alpha] = gem.ComponentTensor(optimised_value, zeta)
@@ -701,7 +761,8 @@ def compile_ufl(expression, interior_facet=False, point_sum=False, **kwargs):
     if interior_facet:
         expressions = []
         for rs in itertools.product(("+", "-"), repeat=len(context.argument_multiindices)):
-            expressions.append(map_expr_dag(PickRestriction(*rs), expression))
+            pick = PickRestriction(*rs, mt_cache=context.translator.mt_cache)
+            expressions.append(map_expr_dag(pick, expression))
     else:
         expressions = [expression]
 
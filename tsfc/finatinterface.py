@@ -83,13 +83,22 @@ element is supported, but must be handled specially because it doesn't
 have a direct FInAT equivalent."""
 
 
+_fiat_cell_cache = {}
+
+
 def as_fiat_cell(cell):
     """Convert a ufl cell to a FIAT cell.
 
     :arg cell: the :class:`ufl.Cell` to convert."""
     if not isinstance(cell, ufl.AbstractCell):
         raise ValueError("Expecting a UFL Cell")
-    return FIAT.ufc_cell(cell)
+    # The FIAT reference cell only depends on the cell name, so
+    # conversions are shared between all UFL cells of the same kind.
+    cellname = cell.cellname()
+    try:
+        return _fiat_cell_cache[cellname]
+    except KeyError:
+        return _fiat_cell_cache.setdefault(cellname, FIAT.ufc_cell(cell))
 
 
 @singledispatch
@@ -62,13 +62,16 @@ class Kernel(object):
 
 class KernelBuilderBase(_KernelBuilderBase):
 
-    def __init__(self, scalar_type, interior_facet=False):
+    def __init__(self, scalar_type, interior_facet=False, table_type=None):
         """Initialise a kernel builder.
 
         :arg interior_facet: kernel accesses two cells
+        :arg table_type: numpy dtype of literal tables, or None to keep
+                         the precision of the tabulation
         """
         super(KernelBuilderBase, self).__init__(scalar_type=scalar_type,
                                                 interior_facet=interior_facet)
+        self.table_type = table_type
 
         # Cell orientation
         if self.interior_facet:
@@ -125,8 +128,9 @@ class KernelBuilderBase(_KernelBuilderBase):
 class ExpressionKernelBuilder(KernelBuilderBase):
     """Builds expression kernels for UFL interpolation in Firedrake."""
 
-    def __init__(self, scalar_type):
-        super(ExpressionKernelBuilder, self).__init__(scalar_type=scalar_type)
+    def __init__(self, scalar_type, table_type=None):
+        super(ExpressionKernelBuilder, self).__init__(scalar_type=scalar_type,
+                                                      table_type=table_type)
         self.oriented = False
         self.cell_sizes = False
 
@@ -176,7 +180,7 @@ class ExpressionKernelBuilder(KernelBuilderBase):
 
         name = "expression_kernel"
         loopy_kernel = generate_loopy(impero_c, args, self.scalar_type,
-                                      name, index_names)
+                                      name, index_names, table_type=self.table_type)
         return ExpressionKernel(loopy_kernel, self.oriented, self.cell_sizes,
                                 self.coefficients, first_coefficient_fake_coords,
                                 self.tabulations, name)
@@ -186,9 +190,10 @@ class KernelBuilder(KernelBuilderBase):
     """Helper class for building a :class:`Kernel` object."""
 
     def __init__(self, integral_type, subdomain_id, domain_number, scalar_type, dont_split=(),
-                 diagonal=False):
+                 diagonal=False, table_type=None):
         """Initialise a kernel builder."""
-        super(KernelBuilder, self).__init__(scalar_type, integral_type.startswith("interior_facet"))
+        super(KernelBuilder, self).__init__(scalar_type, integral_type.startswith("interior_facet"),
+                                            table_type=table_type)
 
         self.kernel = Kernel(integral_type=integral_type, subdomain_id=subdomain_id,
                              domain_number=domain_number)
@@ -303,7 +308,8 @@ class KernelBuilder(KernelBuilderBase):
             args.append(lp.GlobalArg(name_, dtype=self.scalar_type, shape=shape))
 
         self.kernel.quadrature_rule = quadrature_rule
-        self.kernel.ast = generate_loopy(impero_c, args, self.scalar_type, name, index_names)
+        self.kernel.ast = generate_loopy(impero_c, args, self.scalar_type, name, index_names,
+                                         table_type=self.table_type)
         self.kernel.name = name
         return self.kernel
 
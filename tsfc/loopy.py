@@ -43,8 +43,15 @@ def _assign_dtype_real(expression, self):
 
 
 @_assign_dtype.register(gem.Literal)
-def _assign_dtype_identity(expression, self):
-    return expression.array.dtype
+def _assign_dtype_literal(expression, self):
+    if self.table_type is None:
+        return expression.array.dtype
+    # Store literal tables at the requested precision rather than at
+    # the double precision of the tabulation.
+    elif expression.array.dtype.kind == "c":
+        return numpy.result_type(self.table_type, numpy.complex64)
+    else:
+        return numpy.finfo(self.table_type).dtype
 
 
 @_assign_dtype.register(gem.Power)
@@ -83,17 +90,20 @@ def _assign_dtype_logical(expression, self):
     return numpy.int8
 
 
-def assign_dtypes(expressions, scalar_type):
+def assign_dtypes(expressions, scalar_type, table_type=None):
     """Assign numpy data types to expressions.
 
     Used for declaring temporaries when converting from Impero to lower level code.
 
     :arg expressions: List of GEM expressions.
     :arg scalar_type: Default scalar type.
+    :arg table_type: Precision of literal tables, or None to keep
+                     the precision of the tabulation.
 
     :returns: list of tuples (expression, dtype)."""
     mapper = Memoizer(_assign_dtype)
     mapper.scalar_type = scalar_type
+    mapper.table_type = table_type
     if scalar_type.kind == "c":
         mapper.real_type = numpy.finfo(scalar_type).dtype
     else:
@@ -187,7 +197,7 @@ def active_indices(mapping, ctx):
 
 
 def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_names=[],
-             return_increments=True):
+             return_increments=True, table_type=None):
     """Generates loopy code.
 
     :arg impero_c: ImperoC tuple with Impero AST and other data
@@ -196,6 +206,8 @@ def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_name
     :arg kernel_name: function name of the kernel
     :arg index_names: pre-assigned index names
     :arg return_increments: Does codegen for Return nodes increment the lvalue, or assign?
+    :arg table_type: numpy dtype of literal tables, or None to keep
+                     the precision of the tabulation
     :returns: loopy kernel
     """
     ctx = LoopyContext()
@@ -207,10 +219,10 @@ def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_name
 
     # Create arguments
     data = list(args)
-    for i, (temp, dtype) in enumerate(assign_dtypes(impero_c.temporaries, scalar_type)):
+    for i, (temp, dtype) in enumerate(assign_dtypes(impero_c.temporaries, scalar_type, table_type)):
         name = "t%d" % i
         if isinstance(temp, gem.Constant):
-            data.append(lp.TemporaryVariable(name, shape=temp.shape, dtype=dtype, initializer=temp.array, address_space=lp.AddressSpace.LOCAL, read_only=True))
+            data.append(lp.TemporaryVariable(name, shape=temp.shape, dtype=dtype, initializer=temp.array.astype(dtype, copy=False), address_space=lp.AddressSpace.LOCAL, read_only=True))
         else:
             shape = tuple([i.extent for i in ctx.indices[temp]]) + temp.shape
             data.append(lp.TemporaryVariable(name, shape=shape, dtype=dtype, initializer=None, address_space=lp.AddressSpace.LOCAL, read_only=False))
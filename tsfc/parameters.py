@@ -19,6 +19,12 @@ PARAMETERS = {
 
     # So that tests pass (needs to match scalar_type)
     "scalar_type_c": "double",
+
+    # Numpy dtype of literal tables in loopy kernels.  None keeps the
+    # double precision of the tabulation.  Setting it to a single
+    # precision type stores tables, and computes with them, at that
+    # precision, as the COFFEE backend does for single precision kernels.
+    "table_type": None,
 }
 
 
@@ -223,12 +223,16 @@ class PickRestriction(MultiFunction, ModifiedTerminalMixin):
     :arg test: The restriction on the test function.
     :arg trial:  The restriction on the trial function.
 
+    :arg mt_cache: Optional dict of analysed modified terminals, shared
+                   with later passes to avoid analysing them again.
+
     Returns those parts of the expression that have the requested
     restrictions, or else :class:`ufl.classes.Zero` if no such part
     exists.
     """
-    def __init__(self, test=None, trial=None):
+    def __init__(self, test=None, trial=None, mt_cache=None):
         self.restrictions = {0: test, 1: trial}
+        self.mt_cache = {} if mt_cache is None else mt_cache
         MultiFunction.__init__(self)
 
     expr = MultiFunction.reuse_if_untouched
@@ -237,7 +241,9 @@ class PickRestriction(MultiFunction, ModifiedTerminalMixin):
         return o
 
     def modified_terminal(self, o):
-        mt = analyse_modified_terminal(o)
+        mt = self.mt_cache.get(o)
+        if mt is None:
+            mt = self.mt_cache[o] = analyse_modified_terminal(o)
         t = mt.terminal
         r = mt.restriction
         if isinstance(t, Argument) and r != self.restrictions[t.number()]: